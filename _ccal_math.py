@@ -0,0 +1,33 @@
+# Optional Numba-compiled versions of CCAL's rata-die kernels.
+#
+# ccal imports this lazily on the first large navigation jump and
+# rebinds its to_rd/from_rd globals to these; when numba isn't
+# installed the import fails and the pure-Python kernels stay in place.
+# The math must match ccal.to_rd/ccal.from_rd exactly and sticks to
+# int64-friendly arithmetic (no datetime/timedelta, which Numba's
+# nopython mode doesn't support).
+import numba
+
+
+@numba.njit(cache=True)
+def to_rd(year: int, month: int, day: int) -> int:
+	if month <= 2:
+		year -= 1
+		month += 12
+	return 365 * year + year // 4 - year // 100 + year // 400 + (153 * (month - 3) + 2) // 5 + day - 306
+
+
+@numba.njit(cache=True)
+def from_rd(n: int) -> tuple:
+	n += 305  # days since 0000-03-01, the era anchor
+	era = n // 146097
+	doe = n - era * 146097
+	yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+	year = yoe + era * 400
+	doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+	mp = (5 * doy + 2) // 153
+	day = doy - (153 * mp + 2) // 5 + 1
+	month = mp + 3 if mp < 10 else mp - 9
+	if month <= 2:
+		year += 1
+	return year, month, day
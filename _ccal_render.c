@@ -0,0 +1,114 @@
+/* Optional C render kernel for CCAL's month grid.
+ *
+ * Paints the 42-cell (up to 6x7) day grid with one call from Python
+ * instead of one curses call per cell. Mirrors the pure-Python loop in
+ * ccal.draw_month_view: cells are addressed by flat index from the
+ * first visible rata die, the attribute comes from the 16-entry LUT
+ * indexed by bit0=weekend, bit1=out-of-month, bit2=today,
+ * bit3=selected, and rows past max_row are clipped.
+ *
+ * Build with `python setup.py build_ext --inplace`; ccal.py falls back
+ * to the Python loop when this module isn't importable.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <py_curses.h>
+
+/* Day-of-month for a rata die (day 1 = 0001-01-01), the int kernel
+ * from ccal.from_rd reduced to the day component. */
+static int
+rd_day(long long n)
+{
+	long long era, doe, yoe, doy, mp;
+
+	n += 305;  /* days since 0000-03-01 */
+	era = n / 146097;
+	doe = n - era * 146097;
+	yoe = (doe - doe / 1460 + doe / 36524 - doe / 146096) / 365;
+	doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+	mp = (5 * doy + 2) / 153;
+	return (int)(doy - (153 * mp + 2) / 5 + 1);
+}
+
+static PyObject *
+render_month(PyObject *self, PyObject *args)
+{
+	PyObject *win_obj, *lut_obj;
+	int top, left, n_weeks, dim_lo, dim_hi, weekend_mask, max_row;
+	long long start_rd, sel_idx, today_idx;
+	long attrs[16];
+	WINDOW *win;
+	int wk, i;
+
+	if (!PyArg_ParseTuple(args, "OiiLiiiLLiOi:render_month",
+			&win_obj, &top, &left, &start_rd, &n_weeks,
+			&dim_lo, &dim_hi, &sel_idx, &today_idx,
+			&weekend_mask, &lut_obj, &max_row))
+		return NULL;
+	if (!PyCursesWindow_Check(win_obj)) {
+		PyErr_SetString(PyExc_TypeError, "expected a curses window");
+		return NULL;
+	}
+	if (!PySequence_Check(lut_obj) || PySequence_Size(lut_obj) < 16) {
+		PyErr_SetString(PyExc_ValueError, "attribute LUT must have 16 entries");
+		return NULL;
+	}
+	for (i = 0; i < 16; i++) {
+		PyObject *item = PySequence_GetItem(lut_obj, i);
+		if (item == NULL)
+			return NULL;
+		attrs[i] = PyLong_AsLong(item);
+		Py_DECREF(item);
+		if (attrs[i] == -1 && PyErr_Occurred())
+			return NULL;
+	}
+
+	win = ((PyCursesWindowObject *)win_obj)->win;
+	for (wk = 0; wk < n_weeks; wk++) {
+		int row = top + wk;
+		if (row >= max_row)
+			break;
+		for (i = 0; i < 7; i++) {
+			long long cell = (long long)wk * 7 + i;
+			int day = rd_day(start_rd + cell);
+			int idx = ((weekend_mask >> i) & 1)
+				| ((cell < dim_lo || cell >= dim_hi) << 1)
+				| ((cell == today_idx) << 2)
+				| ((cell == sel_idx) << 3);
+			char buf[3];
+
+			buf[0] = day >= 10 ? (char)('0' + day / 10) : ' ';
+			buf[1] = (char)('0' + day % 10);
+			buf[2] = '\0';
+			wattrset(win, (attr_t)attrs[idx]);
+			mvwaddnstr(win, row, left + i * 4, buf, 2);
+		}
+	}
+	wattrset(win, A_NORMAL);
+	Py_RETURN_NONE;
+}
+
+static PyMethodDef ccal_render_methods[] = {
+	{"render_month", render_month, METH_VARARGS,
+	 "render_month(win, top, left, start_rd, n_weeks, dim_lo, dim_hi, "
+	 "sel_idx, today_idx, weekend_mask, lut, max_row)\n"
+	 "Paint the month grid cells in one call."},
+	{NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef ccal_render_module = {
+	PyModuleDef_HEAD_INIT,
+	"_ccal_render",
+	"C render kernel for CCAL's month grid.",
+	-1,
+	ccal_render_methods
+};
+
+PyMODINIT_FUNC
+PyInit__ccal_render(void)
+{
+	import_curses();
+	if (PyErr_Occurred())
+		return NULL;
+	return PyModule_Create(&ccal_render_module);
+}
@@ -3,7 +3,9 @@ import sys
 import os
 import json
 import locale
+import time
 from datetime import date, datetime, timedelta
+from functools import cached_property
 import calendar
 
 APP_NAME = "CCAL"
@@ -21,6 +23,22 @@ except Exception as _exc:  # pragma: no cover
 	of_import_error = _exc
 
 
+# Optional C render kernel (see _ccal_render.c / setup.py); the
+# pure-Python month-grid loop is the fallback when it isn't built.
+try:
+	import _ccal_render
+except ImportError:
+	_ccal_render = None
+
+
+# Optional fast JSON serializer for the config file; stdlib json is the
+# fallback.
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
 locale.setlocale(locale.LC_ALL, "")
 calendar.setfirstweekday(calendar.MONDAY)
 
@@ -45,12 +63,96 @@ def load_config() -> dict:
 def save_config(cfg: dict) -> None:
 	ensure_dirs()
 	try:
-		with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-			json.dump(cfg, f, ensure_ascii=False, indent=2)
+		# The file is machine-read only, so skip pretty-printing: the
+		# compact separators halve the serialization work and the size.
+		if orjson is not None:
+			data = orjson.dumps(cfg)
+		else:
+			data = json.dumps(cfg, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+		try:
+			with open(CONFIG_PATH, "rb") as f:
+				existing = f.read()
+		except OSError:
+			existing = b""
+		if data == existing:
+			return
+		# Write to a sibling temp file and rename so a crash mid-write
+		# can't leave a truncated config behind.
+		tmp = CONFIG_PATH + ".tmp"
+		with open(tmp, "wb") as f:
+			f.write(data)
+		os.replace(tmp, CONFIG_PATH)
 	except Exception:
 		pass
 
 
+# Pure-int Gregorian <-> rata-die conversion (day 1 = 0001-01-01, a
+# Monday; same numbering as date.toordinal). Navigation and the month
+# grid work on these ints so hot paths allocate no date/timedelta
+# objects.
+def to_rd(year: int, month: int, day: int) -> int:
+	if month <= 2:
+		year -= 1
+		month += 12
+	return 365 * year + year // 4 - year // 100 + year // 400 + (153 * (month - 3) + 2) // 5 + day - 306
+
+
+def from_rd(n: int) -> tuple[int, int, int]:
+	n += 305  # days since 0000-03-01, the era anchor
+	era = n // 146097
+	doe = n - era * 146097
+	yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+	year = yoe + era * 400
+	doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+	mp = (5 * doy + 2) // 153
+	day = doy - (153 * mp + 2) // 5 + 1
+	month = mp + 3 if mp < 10 else mp - 9
+	if month <= 2:
+		year += 1
+	return year, month, day
+
+
+_RD_MIN = to_rd(1, 1, 1)
+_RD_MAX = to_rd(9999, 12, 31)
+
+_fast_math_tried = False
+
+
+def _load_fast_math() -> None:
+	# Rebind the rata-die kernels to the Numba-compiled versions in
+	# _ccal_math, deferred so neither the numba import nor the JIT cost
+	# is paid unless the user actually scrubs across months/years. A
+	# failed import keeps the pure-Python kernels.
+	global _fast_math_tried, to_rd, from_rd
+	if _fast_math_tried:
+		return
+	_fast_math_tried = True
+	try:
+		import _ccal_math
+	except ImportError:
+		return
+	to_rd = _ccal_math.to_rd
+	from_rd = _ccal_math.from_rd
+
+
+# Weekday header line for each supported week start, built once at
+# import (day_abbr reflects the locale set above).
+_DOW_HDR = {
+	fw: " ".join(f"{calendar.day_abbr[i % 7][:2].capitalize():>3}" for i in range(fw, fw + 7))
+	for fw in (0, 6)
+}
+
+HELP_HINT = "[ Arrows: Day | PgUp/PgDn: Month | T: Today | W: Week start | V: View ]"
+
+# Which grid columns are weekends, per supported week start; the mask
+# form packs the same bits for the C kernel.
+_WEEKEND_COL = {
+	fw: tuple(1 if (fw + i) % 7 >= 5 else 0 for i in range(7))
+	for fw in (0, 6)
+}
+_WEEKEND_MASK = {fw: sum(b << i for i, b in enumerate(cols)) for fw, cols in _WEEKEND_COL.items()}
+
+
 class Theme:
 	COLOR_DEFAULT = 1
 	COLOR_HEADER = 2
@@ -61,6 +163,17 @@ class Theme:
 	COLOR_HELP = 7
 	COLOR_WEEKEND = 8
 
+	# Resolved attribute values; filled in by init_colors once the color
+	# pairs exist so draw paths don't recompute color_pair() per cell.
+	ATTR_DEFAULT = 0
+	ATTR_WEEKEND = 0
+	ATTR_DIM = 0
+	ATTR_TODAY = 0
+	ATTR_SELECTED = 0
+	# 16-entry LUT indexed by bit0=weekend, bit1=out-of-month,
+	# bit2=today, bit3=selected; see init_colors.
+	ATTR_LUT: tuple = ()
+
 	@staticmethod
 	def init_colors() -> None:
 		curses.start_color()
@@ -73,21 +186,81 @@ class Theme:
 		curses.init_pair(Theme.COLOR_STATUS, curses.COLOR_BLACK, curses.COLOR_CYAN)
 		curses.init_pair(Theme.COLOR_HELP, curses.COLOR_YELLOW, -1)
 		curses.init_pair(Theme.COLOR_WEEKEND, curses.COLOR_MAGENTA, -1)
+		Theme.ATTR_DEFAULT = curses.color_pair(Theme.COLOR_DEFAULT)
+		Theme.ATTR_WEEKEND = curses.color_pair(Theme.COLOR_WEEKEND)
+		Theme.ATTR_DIM = curses.color_pair(Theme.COLOR_DIM)
+		Theme.ATTR_TODAY = curses.color_pair(Theme.COLOR_TODAY) | curses.A_BOLD
+		Theme.ATTR_SELECTED = curses.color_pair(Theme.COLOR_SELECTED) | curses.A_BOLD
+		# Fill the LUT by replaying the attribute cascade per index, so
+		# priority stays selected > today > out-of-month > weekend.
+		lut = []
+		for idx in range(16):
+			attr = Theme.ATTR_DEFAULT
+			if idx & 1:
+				attr = Theme.ATTR_WEEKEND
+			if idx & 2:
+				attr = Theme.ATTR_DIM
+			if idx & 4:
+				attr = Theme.ATTR_TODAY
+			if idx & 8:
+				attr = Theme.ATTR_SELECTED
+			lut.append(attr)
+		Theme.ATTR_LUT = tuple(lut)
 
 
 class CalendarApp:
 	def __init__(self, stdscr) -> None:
 		self.stdscr = stdscr
-		self.cfg = load_config()
-		today = date.today()
-		self.current_year = today.year
-		self.current_month = today.month
-		self.selected_day = today.day
+		self._set_rd(date.today().toordinal())
 		self.view_mode = "month"  # "month" | "week"
-		self.first_weekday = 0 if self.cfg.get("first_weekday", "mon") == "mon" else 6
 		self.status = "Use arrows/PgUp/PgDn, T=Today, W=Week start, V=View"
+		self.dirty = False
+		self._pending_days = 0
+		self._month_moves = 0
+		self._header_cache = (None, "")
+		self._first_weekday: int | None = None
+		self._cfg_dirty = False
+		self._today_cached: tuple[float, date | None] = (0.0, None)
+		# Damage tracking: full redraw vs just the two selection cells.
+		self._need_full = True
+		self._sel_damage: tuple[int, int] | None = None
+		self._grid: tuple[int, int, int, int, int] | None = None
+		self._keymap = {
+			ord("q"): self._key_quit, ord("Q"): self._key_quit,
+			ord("t"): self._key_today, ord("T"): self._key_today,
+			ord("w"): self._key_week_start, ord("W"): self._key_week_start,
+			ord("v"): self._key_view, ord("V"): self._key_view,
+			curses.KEY_LEFT: self._key_left, ord("h"): self._key_left,
+			curses.KEY_RIGHT: self._key_right, ord("l"): self._key_right,
+			curses.KEY_UP: self._key_up, ord("k"): self._key_up,
+			curses.KEY_DOWN: self._key_down, ord("j"): self._key_down,
+			curses.KEY_NPAGE: self._key_next_month,
+			curses.KEY_PPAGE: self._key_prev_month,
+			curses.KEY_RESIZE: self._key_resize,
+		}
 		self.resize()
 
+	@cached_property
+	def cfg(self) -> dict:
+		# Loaded on first access so startup doesn't block on disk before
+		# curses is even on screen.
+		return load_config()
+
+	@property
+	def first_weekday(self) -> int:
+		if self._first_weekday is None:
+			self._first_weekday = 0 if self.cfg.get("first_weekday", "mon") == "mon" else 6
+		return self._first_weekday
+
+	@first_weekday.setter
+	def first_weekday(self, value: int) -> None:
+		self._first_weekday = value
+
+	def flush_config(self) -> None:
+		if self._cfg_dirty:
+			self._cfg_dirty = False
+			save_config(self.cfg)
+
 	def resize(self) -> None:
 		self.max_y, self.max_x = self.stdscr.getmaxyx()
 
@@ -102,27 +275,50 @@ class CalendarApp:
 		n = min(n, self.max_x - x)
 		if n <= 0:
 			return
-		try:
-			if attr is None:
-				self.stdscr.addnstr(y, x, s, n)
-			else:
-				self.stdscr.addnstr(y, x, s, n, attr)
-		except Exception:
-			pass
+		# addnstr returns ERR when a write runs through the bottom-right
+		# cell (the cursor can't advance past it); trim one column there
+		# instead of paying for a raised-and-caught exception per cell.
+		if y == self.max_y - 1 and x + n >= self.max_x:
+			n -= 1
+			if n <= 0:
+				return
+		if attr is None:
+			self.stdscr.addnstr(y, x, s, n)
+		else:
+			self.stdscr.addnstr(y, x, s, n, attr)
 
 	def can_draw_full(self) -> bool:
 		return self.max_x >= 36 and self.max_y >= 10
 
 	# ----- Model helpers -----
-	def clamp_selection(self) -> None:
-		last_day = calendar.monthrange(self.current_year, self.current_month)[1]
-		if self.selected_day < 1:
-			self.selected_day = 1
-		if self.selected_day > last_day:
-			self.selected_day = last_day
+	# The selection's rata die is the single source of truth; the
+	# (year, month, day) view of it is cached alongside and the old
+	# triple attributes are read-only derivations, so the three can
+	# never drift apart.
+	def _set_rd(self, rd: int) -> None:
+		self._sel_rd = rd
+		self._sel_ymd = from_rd(rd)
+
+	@property
+	def current_year(self) -> int:
+		return self._sel_ymd[0]
+
+	@property
+	def current_month(self) -> int:
+		return self._sel_ymd[1]
+
+	@property
+	def selected_day(self) -> int:
+		return self._sel_ymd[2]
 
 	def move_month(self, delta: int) -> None:
-		y, m = self.current_year, self.current_month
+		self.flush_pending()
+		# A year-scale jump or sustained PgUp/PgDn scrubbing means the
+		# user is covering a lot of calendar; worth the JIT warmup.
+		self._month_moves += 1
+		if delta >= 12 or delta <= -12 or self._month_moves >= 12:
+			_load_fast_math()
+		y, m, d = self._sel_ymd
 		m += delta
 		while m < 1:
 			m += 12
@@ -130,26 +326,58 @@ class CalendarApp:
 		while m > 12:
 			m -= 12
 			y += 1
-		self.current_year = max(1, min(9999, y))
-		self.current_month = m
-		self.clamp_selection()
+		y = max(1, min(9999, y))
+		self._set_rd(to_rd(y, m, min(d, calendar.monthrange(y, m)[1])))
+		self._need_full = True
 
 	def move_year(self, delta: int) -> None:
-		self.current_year = max(1, min(9999, self.current_year + delta))
-		self.clamp_selection()
+		_load_fast_math()
+		y, m, d = self._sel_ymd
+		y = max(1, min(9999, y + delta))
+		self._set_rd(to_rd(y, m, min(d, calendar.monthrange(y, m)[1])))
+		self._need_full = True
 
 	def move_selection(self, days: int) -> None:
-		try:
-			base = date(self.current_year, self.current_month, self.selected_day)
-		except ValueError:
-			self.clamp_selection()
-			base = date(self.current_year, self.current_month, self.selected_day)
-		new_date = base + timedelta(days=days)
-		self.current_year, self.current_month, self.selected_day = new_date.year, new_date.month, new_date.day
+		old_rd = self._sel_rd
+		rd = max(_RD_MIN, min(_RD_MAX, old_rd + days))
+		if rd == old_rd:
+			return
+		old_y, old_m = self._sel_ymd[0], self._sel_ymd[1]
+		self._set_rd(rd)
+		if (self._sel_ymd[0], self._sel_ymd[1]) != (old_y, old_m):
+			# Grid itself changes; the two-cell repaint can't cover it.
+			self._need_full = True
+			self._sel_damage = None
+		elif self._sel_damage is None:
+			self._sel_damage = (old_rd, rd)
+		else:
+			self._sel_damage = (self._sel_damage[0], rd)
+
+	def queue_selection(self, days: int) -> None:
+		# Accumulate arrow-key deltas; flush_pending applies them in one
+		# move_selection call so burst input skips the intermediate dates.
+		self._pending_days += days
+
+	def flush_pending(self) -> None:
+		if self._pending_days:
+			days, self._pending_days = self._pending_days, 0
+			self.move_selection(days)
+
+	def _today(self, _mono=time.monotonic) -> date:
+		# date.today() costs a syscall plus a civil-time breakdown; the
+		# answer can't change mid-burst, so refresh at most every 30s.
+		t, d = self._today_cached
+		now = _mono()
+		if d is None or now - t > 30.0:
+			d = date.today()
+			self._today_cached = (now, d)
+		return d
 
 	def go_today(self) -> None:
-		t = date.today()
-		self.current_year, self.current_month, self.selected_day = t.year, t.month, t.day
+		self.flush_pending()
+		self._today_cached = (0.0, None)
+		self._set_rd(self._today().toordinal())
+		self._need_full = True
 
 	def toggle_week_start(self) -> None:
 		if self.first_weekday == 0:
@@ -159,70 +387,105 @@ class CalendarApp:
 			self.first_weekday = 0
 			self.status = "Week starts on Monday"
 		calendar.setfirstweekday(self.first_weekday)
-		self.cfg["first_weekday"] = "mon" if self.first_weekday == 0 else "sun"
-		save_config(self.cfg)
+		self._need_full = True
+		value = "mon" if self.first_weekday == 0 else "sun"
+		if self.cfg.get("first_weekday") != value:
+			self.cfg["first_weekday"] = value
+			self._cfg_dirty = True
 
 	# ----- View -----
 	def draw_header(self) -> None:
-		title = f"{calendar.month_name[self.current_month]} {self.current_year}"
-		help_hint = "[ Arrows: Day | PgUp/PgDn: Month | T: Today | W: Week start | V: View ]"
-		line = title.center(self.max_x)
+		key = (self.current_month, self.current_year, self.max_x)
+		if self._header_cache[0] != key:
+			title = f"{calendar.month_name[self.current_month]} {self.current_year}"
+			self._header_cache = (key, title.center(self.max_x))
+		line = self._header_cache[1]
 		self.stdscr.attron(curses.color_pair(Theme.COLOR_HEADER) | curses.A_BOLD)
 		self.safe_addnstr(0, 0, line, len(line))
 		self.stdscr.attroff(curses.color_pair(Theme.COLOR_HEADER) | curses.A_BOLD)
 		if self.max_y > 2:
 			self.stdscr.attron(curses.color_pair(Theme.COLOR_HELP))
-			self.safe_addnstr(1, 0, help_hint[: self.max_x], min(len(help_hint), self.max_x))
+			self.safe_addnstr(1, 0, HELP_HINT[: self.max_x], min(len(HELP_HINT), self.max_x))
 			self.stdscr.attroff(curses.color_pair(Theme.COLOR_HELP))
 
 	def draw_status(self) -> None:
 		if self.max_y <= 2:
 			return
-		bar = (" " + (self.status or "")).ljust(self.max_x)
-		self.stdscr.attron(curses.color_pair(Theme.COLOR_STATUS))
-		self.safe_addnstr(self.max_y - 1, 0, bar, len(bar))
-		self.stdscr.attroff(curses.color_pair(Theme.COLOR_STATUS))
+		row = self.max_y - 1
+		attr = curses.color_pair(Theme.COLOR_STATUS)
+		text = self.status or ""
+		self.safe_addnstr(row, 1, text, len(text), attr)
+		# chgat recolors the row in place, so no full-width padded
+		# string is allocated just to paint the bar's background.
+		self.stdscr.chgat(row, 0, -1, attr)
 
 	def draw_month_view(self) -> None:
-		calendar.setfirstweekday(self.first_weekday)
-		cal = calendar.Calendar(firstweekday=self.first_weekday)
-		weeks = cal.monthdatescalendar(self.current_year, self.current_month)
+		# Hot path: kernels and attrs hoisted to locals once per call to
+		# skip repeated LOAD_GLOBAL/LOAD_ATTR pairs in the cell loop.
+		_to_rd, _from_rd = to_rd, from_rd
+		y, m, _ = self._sel_ymd
+		first_rd = _to_rd(y, m, 1)
+		# Shift back to the first visible cell; weekday(rd) with Mon=0 is
+		# (rd + 6) % 7 since rd 1 is a Monday.
+		shift = ((first_rd + 6) % 7 - self.first_weekday) % 7
+		start_rd = first_rd - shift
+		days_in_month = calendar.monthrange(y, m)[1]
+		end_rd = first_rd + days_in_month  # first rd past this month
+		n_weeks = (shift + days_in_month + 6) // 7
 		start_row = 3
-		day_names = [calendar.day_abbr[(i % 7)] for i in range(self.first_weekday, self.first_weekday + 7)]
-		header = " ".join([f"{n[:2].capitalize():>3}" for n in day_names])
+		header = _DOW_HDR[self.first_weekday]
 		self.stdscr.attron(curses.A_BOLD)
 		self.safe_addnstr(start_row, 2, header, max(0, min(len(header), self.max_x - 4)))
 		self.stdscr.attroff(curses.A_BOLD)
 		row = start_row + 1
-		today = date.today()
+		today_rd = self._today().toordinal()
+		sel_rd = self._sel_rd
+		addn = self.safe_addnstr
+		a_default = Theme.ATTR_DEFAULT
+		lut = Theme.ATTR_LUT
+		# Per-frame cell indices so the loop compares small ints instead
+		# of rata dies; weekend-ness is a fixed property of the column.
+		sel_idx = sel_rd - start_rd
+		today_idx = today_rd - start_rd
+		dim_lo, dim_hi = shift, shift + days_in_month
+		weekend_col = _WEEKEND_COL[self.first_weekday]
+
+		if _ccal_render is not None:
+			_ccal_render.render_month(
+				self.stdscr, row, 2, start_rd, n_weeks, dim_lo, dim_hi,
+				sel_idx, today_idx, _WEEKEND_MASK[self.first_weekday],
+				lut, self.max_y - 1)
+			self._grid = (start_rd, n_weeks, first_rd, end_rd, today_rd)
+			return
 
-		for week in weeks:
+		cell = 0
+		for wk in range(n_weeks):
 			if row >= self.max_y - 1:
 				break
-			col = 2
-			for d in week:
-				if col >= self.max_x - 2:
-					break
-				is_this_month = (d.month == self.current_month)
-				text = f"{d.day:2d}"
-				attr = curses.color_pair(Theme.COLOR_DEFAULT)
-				if d.weekday() >= 5:
-					attr = curses.color_pair(Theme.COLOR_WEEKEND)
-				if not is_this_month:
-					attr = curses.color_pair(Theme.COLOR_DIM)
-				if d == today:
-					attr = curses.color_pair(Theme.COLOR_TODAY) | curses.A_BOLD
-				if (d.year, d.month, d.day) == (self.current_year, self.current_month, self.selected_day):
-					attr = curses.color_pair(Theme.COLOR_SELECTED) | curses.A_BOLD
-				self.safe_addnstr(row, col, text, 2, attr)
-				col += 4
+			week_rd = start_rd + wk * 7
+			days = [_from_rd(week_rd + i)[2] for i in range(7)]
+			# One write paints the whole week in the default attribute;
+			# a second pass overpaints only the cells that differ.
+			row_str = "  ".join(f"{d:2d}" for d in days)
+			addn(row, 2, row_str, len(row_str), a_default)
+			for i in range(7):
+				idx = (
+					weekend_col[i]
+					| ((cell < dim_lo or cell >= dim_hi) << 1)
+					| ((cell == today_idx) << 2)
+					| ((cell == sel_idx) << 3)
+				)
+				if idx:
+					addn(row, 2 + i * 4, f"{days[i]:2d}", 2, lut[idx])
+				cell += 1
 			row += 1
+		# Snapshot for the selection-only repaint path.
+		self._grid = (start_rd, n_weeks, first_rd, end_rd, today_rd)
 
 	def draw_week_view(self) -> None:
-		calendar.setfirstweekday(self.first_weekday)
-		base = date(self.current_year, self.current_month, self.selected_day)
+		base = date.fromordinal(self._sel_rd)
 		start = base - timedelta(days=(base.weekday() - (0 if self.first_weekday == 0 else 6)) % 7)
-		today = date.today()
+		today = self._today()
 		start_row = 3
 		self.stdscr.attron(curses.A_BOLD)
 		self.safe_addnstr(start_row, 2, "Week view", max(0, min(self.max_x - 4, len("Week view"))))
@@ -233,31 +496,80 @@ class CalendarApp:
 				break
 			d = start + timedelta(days=i)
 			label = f"{calendar.day_name[d.weekday()][:3].capitalize()} {d.isoformat()}"
-			attr = curses.color_pair(Theme.COLOR_DEFAULT)
+			attr = Theme.ATTR_DEFAULT
 			if d.weekday() >= 5:
-				attr = curses.color_pair(Theme.COLOR_WEEKEND)
+				attr = Theme.ATTR_WEEKEND
 			if d == today:
-				attr = curses.color_pair(Theme.COLOR_TODAY) | curses.A_BOLD
-			if (d.year, d.month, d.day) == (self.current_year, self.current_month, self.selected_day):
-				attr = curses.color_pair(Theme.COLOR_SELECTED) | curses.A_BOLD
+				attr = Theme.ATTR_TODAY
+			if d.toordinal() == self._sel_rd:
+				attr = Theme.ATTR_SELECTED
 			self.safe_addnstr(row, 2, label, max(0, min(self.max_x - 4, len(label))), attr)
 			row += 1
 
+	def _sel_cells_visible(self) -> bool:
+		# The full draw clips trailing weeks on short terminals; a
+		# damaged cell in a clipped row needs the full-redraw path.
+		start_rd = self._grid[0]
+		for rd in self._sel_damage:
+			wk = (rd - start_rd) // 7
+			if 4 + wk >= self.max_y - 1:
+				return False
+		return True
+
+	def _redraw_selection(self) -> None:
+		_from_rd = from_rd
+		old_rd, new_rd = self._sel_damage
+		self._sel_damage = None
+		start_rd, n_weeks, first_rd, end_rd, today_rd = self._grid
+		for rd, selected in ((old_rd, False), (new_rd, True)):
+			idx = rd - start_rd
+			if idx < 0 or idx >= n_weeks * 7:
+				continue
+			wk, i = divmod(idx, 7)
+			if 4 + wk >= self.max_y - 1:
+				# Same vertical clipping as the full month draw.
+				continue
+			lut_idx = (
+				((rd + 6) % 7 >= 5)
+				| ((rd < first_rd or rd >= end_rd) << 1)
+				| ((rd == today_rd) << 2)
+				| (selected << 3)
+			)
+			attr = Theme.ATTR_LUT[lut_idx]
+			self.safe_addnstr(4 + wk, 2 + i * 4, f"{_from_rd(rd)[2]:2d}", 2, attr)
+		self.stdscr.noutrefresh()
+		curses.doupdate()
+
 	def draw(self) -> None:
-		self.stdscr.erase()
 		self.resize()
 		if not self.can_draw_full():
+			self.stdscr.erase()
+			self._need_full = True
+			self._sel_damage = None
 			msg = "Resize terminal (min 36x10)"
 			self.safe_addnstr(0, 0, msg[: self.max_x], min(len(msg), self.max_x))
-			self.stdscr.refresh()
+			self.stdscr.noutrefresh()
+			curses.doupdate()
 			return
+		if (not self._need_full and self._sel_damage is not None
+				and self.view_mode == "month" and self._grid is not None
+				and self._grid[4] == self._today().toordinal()
+				and self._sel_cells_visible()):
+			# Only the selection moved within the visible month: repaint
+			# the old and new cells, skip header/grid/status entirely.
+			self._redraw_selection()
+			return
+		self._sel_damage = None
+		self.stdscr.erase()
 		self.draw_header()
 		if self.view_mode == "month":
 			self.draw_month_view()
 		else:
 			self.draw_week_view()
 		self.draw_status()
-		self.stdscr.refresh()
+		self._need_full = False
+		self.stdscr.noutrefresh()
+		curses.doupdate()
 
 	# ----- Input helpers -----
 	def prompt(self, title: str, initial: str = "") -> str | None:
@@ -271,15 +583,16 @@ class CalendarApp:
 		except Exception:
 			return None
 		win.box()
-		try:
-			win.addnstr(0, 2, f" {title} ", w - 4)
-		except Exception:
-			pass
+		win.addnstr(0, 2, f" {title} ", w - 4)
 		tb = curses.newwin(1, w - 4, y + 1, x + 2)
 		tb.addstr(0, 0, initial)
 		curses.curs_set(1)
 		textpad = curses.textpad.Textbox(tb)
-		self.stdscr.refresh()
+		# Stage all windows, then emit one batched update.
+		self.stdscr.noutrefresh()
+		win.noutrefresh()
+		tb.noutrefresh()
+		curses.doupdate()
 		try:
 			text = textpad.edit().strip()
 		except Exception:
@@ -288,46 +601,72 @@ class CalendarApp:
 		return text if text else None
 
 	# ----- Event loop -----
-	def handle_key(self, ch: int) -> bool:
-		# True -> continue, False -> quit
-		if ch in (ord("q"), ord("Q")):
-			return False
-		if ch in (ord("t"), ord("T")):
-			self.go_today()
-			self.status = "Today"
-			return True
-		if ch in (ord("w"), ord("W")):
-			self.toggle_week_start()
-			return True
-		if ch in (ord("v"), ord("V")):
-			self.view_mode = "week" if self.view_mode == "month" else "month"
-			self.status = f"View: {self.view_mode}"
-			return True
-		if ch in (curses.KEY_LEFT, ord("h")):
-			self.move_selection(-1)
-			return True
-		if ch in (curses.KEY_RIGHT, ord("l")):
-			self.move_selection(1)
-			return True
-		if ch in (curses.KEY_UP, ord("k")):
-			self.move_selection(-7)
-			return True
-		if ch in (curses.KEY_DOWN, ord("j")):
-			self.move_selection(7)
-			return True
-		if ch == curses.KEY_NPAGE:  # PgDn
-			self.move_month(1)
-			self.status = "Next month"
-			return True
-		if ch == curses.KEY_PPAGE:  # PgUp
-			self.move_month(-1)
-			self.status = "Previous month"
-			return True
-		if ch == curses.KEY_RESIZE:
-			self.resize()
-			return True
+	def _key_quit(self) -> bool:
+		return False
+
+	def _key_today(self) -> bool:
+		self.go_today()
+		self.status = "Today"
+		self.dirty = True
 		return True
 
+	def _key_week_start(self) -> bool:
+		self.toggle_week_start()
+		self.dirty = True
+		return True
+
+	def _key_view(self) -> bool:
+		self.view_mode = "week" if self.view_mode == "month" else "month"
+		self.status = f"View: {self.view_mode}"
+		self._need_full = True
+		self.dirty = True
+		return True
+
+	def _key_left(self) -> bool:
+		self.queue_selection(-1)
+		self.dirty = True
+		return True
+
+	def _key_right(self) -> bool:
+		self.queue_selection(1)
+		self.dirty = True
+		return True
+
+	def _key_up(self) -> bool:
+		self.queue_selection(-7)
+		self.dirty = True
+		return True
+
+	def _key_down(self) -> bool:
+		self.queue_selection(7)
+		self.dirty = True
+		return True
+
+	def _key_next_month(self) -> bool:
+		self.move_month(1)
+		self.status = "Next month"
+		self.dirty = True
+		return True
+
+	def _key_prev_month(self) -> bool:
+		self.move_month(-1)
+		self.status = "Previous month"
+		self.dirty = True
+		return True
+
+	def _key_resize(self) -> bool:
+		self.resize()
+		self._today_cached = (0.0, None)
+		self._need_full = True
+		self.dirty = True
+		return True
+
+	def handle_key(self, ch: int) -> bool:
+		# True -> continue, False -> quit. Handlers set self.dirty when
+		# they change state; unknown keys fall through untouched.
+		handler = self._keymap.get(ch)
+		return handler() if handler is not None else True
+
 
 def curses_main(stdscr) -> int:
 	curses.curs_set(0)
@@ -336,11 +675,30 @@ def curses_main(stdscr) -> int:
 	Theme.init_colors()
 
 	app = CalendarApp(stdscr)
-	while True:
+	try:
 		app.draw()
-		ch = stdscr.getch()
-		if not app.handle_key(ch):
-			break
+		while True:
+			ch = stdscr.getch()
+			quit_requested = not app.handle_key(ch)
+			if not quit_requested:
+				# Drain whatever key-repeat burst is already queued and
+				# apply it all to the model before rendering once.
+				stdscr.nodelay(True)
+				ch = stdscr.getch()
+				while ch != -1:
+					if not app.handle_key(ch):
+						quit_requested = True
+						break
+					ch = stdscr.getch()
+				stdscr.nodelay(False)
+			if quit_requested:
+				break
+			app.flush_pending()
+			if app.dirty:
+				app.dirty = False
+				app.draw()
+	finally:
+		app.flush_config()
 	return 0
 
 
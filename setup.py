@@ -0,0 +1,12 @@
+from setuptools import Extension, setup
+
+# The C render kernel is optional: ccal.py falls back to its pure-Python
+# month-grid loop when _ccal_render isn't built or importable.
+setup(
+	name="ccal",
+	version="0.1.0",
+	py_modules=["ccal"],
+	ext_modules=[
+		Extension("_ccal_render", ["_ccal_render.c"], libraries=["ncursesw"]),
+	],
+)